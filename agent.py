@@ -8,6 +8,7 @@ from flask import Flask, jsonify, request
 import pyperclip
 import io
 import base64
+import hashlib
 import psutil
 from PIL import ImageGrab
 from comtypes import CLSCTX_ALL
@@ -75,7 +76,9 @@ def screenshot():
         img_byte_arr.seek(0)
         
         from flask import send_file
-        return send_file(img_byte_arr, mimetype='image/jpeg')
+        response = send_file(img_byte_arr, mimetype='image/jpeg')
+        response.headers['X-Frame-Hash'] = hashlib.sha256(img_byte_arr.getvalue()).hexdigest()
+        return response
     except Exception as e:
         logger.error(f"Screenshot error: {e}")
         return jsonify({"error": str(e)}), 500
@@ -10,3 +10,5 @@ AGENT_PORT = int(os.getenv("AGENT_PORT", 8000))
 ALLOWED_USERS = list(
     map(int, os.getenv("ALLOWED_USERS", "").split(",")) if os.getenv("ALLOWED_USERS") else []
 )
+MEDIA_CACHE_PATH = os.getenv("MEDIA_CACHE_PATH", "media_cache.json")
+MEDIA_CACHE_SIZE = int(os.getenv("MEDIA_CACHE_SIZE", 256))
@@ -4,13 +4,15 @@ import platform
 import httpx
 from telegram import Update, ReplyKeyboardMarkup, KeyboardButton
 from telegram.ext import ContextTypes
-from bot.config import ALLOWED_USERS, TARGET_MAC, TARGET_HOST, AGENT_PORT
+from bot.config import ALLOWED_USERS, TARGET_MAC, TARGET_HOST, AGENT_PORT, MEDIA_CACHE_PATH, MEDIA_CACHE_SIZE
 from bot.wol import wake
 from bot.voice import speech_to_text
 from bot.ai import parse_intent
+from bot.media_cache import MediaCache
 from telegram.ext import MessageHandler, filters
 
 AGENT_URL = f"http://{TARGET_HOST}:{AGENT_PORT}"
+media_cache = MediaCache(MEDIA_CACHE_PATH, MEDIA_CACHE_SIZE)
 
 def is_allowed(user_id: int) -> bool:
     return user_id in ALLOWED_USERS
@@ -155,7 +157,11 @@ async def screenshot_handler(update: Update, context: ContextTypes.DEFAULT_TYPE)
         async with httpx.AsyncClient(timeout=10.0) as client:
             r = await client.get(f"{AGENT_URL}/screenshot")
             if r.status_code == 200:
-                await update.effective_message.reply_photo(r.content, caption="📸 <b>Screenshot</b>", parse_mode="HTML", reply_markup=get_keyboard())
+                await media_cache.send(
+                    r.content,
+                    lambda photo: update.effective_message.reply_photo(photo, caption="📸 <b>Screenshot</b>", parse_mode="HTML", reply_markup=get_keyboard()),
+                    key=r.headers.get("X-Frame-Hash")
+                )
             else:
                 await update.effective_message.reply_text(f"⚠️ <b>Error:</b> Agent returned {r.status_code}", parse_mode="HTML")
     except Exception:
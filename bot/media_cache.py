@@ -0,0 +1,107 @@
+import os
+import json
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from telegram.error import BadRequest
+
+logger = logging.getLogger(__name__)
+
+
+def _file_id_from(message) -> str | None:
+    if message.photo:
+        return message.photo[-1].file_id
+    for attr in ("document", "video", "animation", "audio", "voice"):
+        media = getattr(message, attr, None)
+        if media:
+            return media.file_id
+    return None
+
+
+class MediaCache:
+    """Maps content hashes of outgoing media to Telegram file_ids (LRU, persisted as JSON)."""
+
+    def __init__(self, path: str, max_entries: int = 256):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.bytes_saved = 0
+        self._locks = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for key, file_id in data.get("entries", []):
+                self.entries[key] = file_id
+            self.bytes_saved = int(data.get("bytes_saved", 0))
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        except Exception as e:
+            logger.warning(f"Media cache load error: {e}")
+            self.entries.clear()
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": list(self.entries.items()), "bytes_saved": self.bytes_saved}, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Media cache save error: {e}")
+
+    def get(self, key: str) -> str | None:
+        file_id = self.entries.get(key)
+        if file_id is not None:
+            self.entries.move_to_end(key)
+        return file_id
+
+    def put(self, key: str, file_id: str):
+        self.entries[key] = file_id
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self._save()
+
+    def discard(self, key: str):
+        if self.entries.pop(key, None) is not None:
+            self._save()
+
+    async def send(self, data: bytes, send_func, key: str | None = None):
+        """Sends `data` via `send_func`, passing a cached file_id instead of the bytes when possible.
+
+        `send_func` is called with either the raw bytes or a file_id string and must
+        return the sent Message (e.g. a bound `reply_photo`).
+        """
+        key = key or hashlib.sha256(data).hexdigest()
+        lock, users = self._locks.get(key, (asyncio.Lock(), 0))
+        self._locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                file_id = self.get(key)
+                if file_id is not None:
+                    try:
+                        message = await send_func(file_id)
+                        self.bytes_saved += len(data)
+                        self._save()
+                        logger.info(f"Media cache hit {key[:12]}: saved {len(data)} bytes ({self.bytes_saved} total)")
+                        return message
+                    except BadRequest as e:
+                        logger.warning(f"Cached file_id rejected, re-uploading: {e}")
+                        self.discard(key)
+
+                message = await send_func(data)
+                file_id = _file_id_from(message)
+                if file_id:
+                    self.put(key, file_id)
+                return message
+        finally:
+            lock, users = self._locks[key]
+            if users == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, users - 1)